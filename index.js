@@ -1,9 +1,12 @@
 const express = require('express');
 const cors = require('cors');
-const { getElementPlusIcons, getAntDesignIcons } = require('./services/icons');
+const { searchIconsMany } = require('./services/icons');
+const { generateIcon } = require('./services/iconGenerator');
+const { listen } = require('./services/listen');
 // const logger = require('./services/logger');
 const app = express();
 const PORT = process.env.PORT || 3000;
+const SOCKET_PATH = process.env.ICON_MCP_SOCKET;
 
 /**
  * 自定义 JSON 响应，确保 svg 和 rawSvg 字段不被转义
@@ -80,53 +83,8 @@ app.get('/api/icons/search', async (req, res) => {
       return res.status(400).json({ error: 'At least one valid name is required' });
     }
 
-    const allIcons = [];
-
-    // 对每个名称进行搜索
-    for (const searchName of nameArray) {
-      try {
-        // logger.debug('Fetching icons for name', { searchTerm: searchName, style });
-
-        // 根据 style 参数决定搜索哪些图标库
-        // style: 'element-plus' 只搜索 Element Plus
-        // style: 'ant-design' 只搜索 Ant Design
-        // 未指定或 'default' 则两者都搜索
-        if (!style || style === 'default') {
-          // 两者都搜索
-          const elementPlusIcons = await getElementPlusIcons(searchName);
-          const antDesignIcons = await getAntDesignIcons(searchName);
-          allIcons.push(...elementPlusIcons, ...antDesignIcons);
-        } else if (style === 'element-plus') {
-          // 只搜索 Element Plus
-          const elementPlusIcons = await getElementPlusIcons(searchName);
-          allIcons.push(...elementPlusIcons);
-        } else if (style === 'ant-design') {
-          // 只搜索 Ant Design
-          const antDesignIcons = await getAntDesignIcons(searchName);
-          allIcons.push(...antDesignIcons);
-        } else {
-          // 无效的 style 参数，两者都搜索
-          const elementPlusIcons = await getElementPlusIcons(searchName);
-          const antDesignIcons = await getAntDesignIcons(searchName);
-          allIcons.push(...elementPlusIcons, ...antDesignIcons);
-        }
-
-        // logger.debug('Icons fetched for name', {
-        //   searchTerm: searchName,
-        //   style,
-        //   resultCount: allIcons.length
-        // });
-      } catch (error) {
-        // logger.error(`Failed to fetch icons for ${searchName}`, {
-        //   error: error.message
-        // });
-      }
-    }
-
-    // 去重（基于 source 和 name）
-    const uniqueIcons = Array.from(
-      new Map(allIcons.map((icon) => [`${icon.source}-${icon.name}`, icon])).values()
-    );
+    // 一次请求批量搜索所有名称，并去重（基于 source 和 name）
+    const uniqueIcons = await searchIconsMany(nameArray, style);
 
     // 记录请求完成
     // logger.info('Icon search completed', {
@@ -163,7 +121,6 @@ async function handleIconGeneration(params, res) {
       return res.status(400).json({ error: 'Description parameter is required' });
     }
 
-    const { generateIcon } = require('./services/iconGenerator');
     const generatedIcon = await generateIcon(description, style, model);
 
     // logger.info('Icon generation completed', {
@@ -197,7 +154,7 @@ app.post('/api/icons/generate', async (req, res) => {
 });
 
 // 启动服务器
-app.listen(PORT, '0.0.0.0', () => {
+listen(app, { port: PORT, socketPath: SOCKET_PATH }, () => {
   const ipAddress = Object.values(require('os').networkInterfaces())
     .flat()
     .find(iface => !iface.internal && iface.family === 'IPv4')?.address || 'localhost';
@@ -1,6 +1,6 @@
 #!/usr/bin/env node
 // 先导入基础模块
-const { getElementPlusIcons, getAntDesignIcons } = require('./services/icons');
+const { searchIconsMany } = require('./services/icons');
 const { generateIcon } = require('./services/iconGenerator');
 const z = require('zod');
 
@@ -75,20 +75,8 @@ server.tool(
       .map((name) => name.trim())
       .filter((name) => name.length > 0);
 
-    const allIcons = [];
-
-    // 对每个名称进行搜索
-    for (const name of nameArray) {
-      try {
-        const elementPlusIcons = await getElementPlusIcons(name);
-        const antDesignIcons = await getAntDesignIcons(name);
-
-        allIcons.push(...elementPlusIcons, ...antDesignIcons);
-      } catch (error) { }
-    }
-
-    // 去重（基于 source 和 name）
-    const uniqueIcons = Array.from(new Map(allIcons.map((icon) => [`${icon.source}-${icon.name}`, icon])).values());
+    // 批量搜索所有名称，并去重（基于 source 和 name）
+    const uniqueIcons = await searchIconsMany(nameArray);
     // 生成 markdown 表格
     const markdownTable = iconsToMarkdownTable(uniqueIcons);
     // 仅返回 markdown 表格，确保返回格式符合MCP协议要求
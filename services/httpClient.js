@@ -0,0 +1,86 @@
+const http = require('http');
+const https = require('https');
+const axios = require('axios');
+
+/**
+ * 复用 TCP/TLS 连接的 Agent，避免每次请求都重新进行 DNS 查询和握手
+ */
+const agentOptions = {
+  keepAlive: true,
+  maxSockets: 20,
+  maxFreeSockets: 10,
+};
+
+const httpAgent = new http.Agent(agentOptions);
+const httpsAgent = new https.Agent(agentOptions);
+
+/**
+ * 共享的 axios 实例，所有对外 HTTP 请求都应通过它发出
+ */
+const httpClient = axios.create({
+  httpAgent,
+  httpsAgent,
+});
+
+/**
+ * 瞬时错误的重试策略：对网关错误和连接错误进行指数退避重试
+ * GET 请求是幂等的，可以对网关错误和所有连接错误重试；
+ * 其他请求（如 generateSVGWithOpenAI、generateSVGWithTongyi 中按次计费的模型调用）只在请求确定未发出时重试，避免重复执行
+ */
+const RETRY_TOTAL = 3;
+const RETRY_BACKOFF_FACTOR = 200; // 毫秒
+const RETRY_STATUS_CODES = [502, 503, 504];
+// 不包含 ETIMEDOUT：未设置 timeout 的请求每次超时都要等待系统连接超时，重试会把一次失败拖到数分钟
+const RETRY_ERROR_CODES = ['ECONNRESET', 'ECONNREFUSED', 'EPIPE', 'EAI_AGAIN'];
+// 连接尚未建立时的错误，请求一定没有到达服务端
+const NOT_SENT_ERROR_CODES = ['ECONNREFUSED', 'EAI_AGAIN'];
+
+/**
+ * 判断请求失败是否可以重试
+ * 单个请求可以通过 config.retry = false 关闭自动重试
+ * @param {Error} error - axios 抛出的错误
+ * @returns {boolean} 是否可以重试
+ */
+function isRetryable(error) {
+  const config = error.config;
+  if (!config || config.retry === false) {
+    return false;
+  }
+  if (config.method !== 'get') {
+    return !error.response && NOT_SENT_ERROR_CODES.includes(error.code);
+  }
+  if (error.response) {
+    return RETRY_STATUS_CODES.includes(error.response.status);
+  }
+  return RETRY_ERROR_CODES.includes(error.code);
+}
+
+httpClient.interceptors.response.use(null, async (error) => {
+  if (!isRetryable(error)) {
+    throw error;
+  }
+
+  const config = error.config;
+  config.retryCount = (config.retryCount || 0) + 1;
+  if (config.retryCount > RETRY_TOTAL) {
+    throw error;
+  }
+
+  // 退避时间：200ms, 400ms, 800ms
+  const delay = RETRY_BACKOFF_FACTOR * 2 ** (config.retryCount - 1);
+  await new Promise((resolve) => setTimeout(resolve, delay));
+  return httpClient.request(config);
+});
+
+/**
+ * 关闭连接池中的所有连接
+ */
+function closeHttpClient() {
+  httpAgent.destroy();
+  httpsAgent.destroy();
+}
+
+module.exports = {
+  httpClient,
+  closeHttpClient,
+};
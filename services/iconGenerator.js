@@ -1,6 +1,6 @@
-const axios = require('axios');
+const { httpClient } = require('./httpClient');
 // const logger = require('./logger');
-const { getElementPlusIcons, getAntDesignIcons } = require('./icons');
+const { searchIconsMany } = require('./icons');
 
 /**
  * 支持的 AI 模型类型
@@ -15,6 +15,70 @@ const AI_MODELS = {
   HUGGINGFACE: 'huggingface', // Hugging Face（免费，无需 API Key）
 };
 
+/**
+ * SVG 代码生成的风格规范
+ */
+const SVG_STYLE_GUIDELINES = {
+  'element-plus': {
+    style: 'Element Plus',
+    characteristics: 'minimalist, clean lines, modern, simple geometric shapes, single color (currentColor), 24x24 viewBox',
+    examples: 'Use simple paths, circles, rectangles. Avoid complex gradients. Use fill="currentColor" for single color icons.'
+  },
+  'ant-design': {
+    style: 'Ant Design',
+    characteristics: 'professional, consistent stroke width (1.5-2px), rounded corners, balanced proportions, 24x24 viewBox',
+    examples: 'Use stroke-based design, consistent line width, rounded end caps. Use fill="none" and stroke="currentColor".'
+  },
+  default: {
+    style: 'Simple',
+    characteristics: 'clean, simple, modern, 24x24 viewBox, single color',
+    examples: 'Use simple shapes, clear lines, fill="currentColor" or stroke="currentColor".'
+  }
+};
+
+/**
+ * 常见图标关键词映射（用于从描述中提取搜索关键词）
+ */
+const KEYWORD_MAP = {
+  '删除': 'delete',
+  'delete': 'delete',
+  'remove': 'delete',
+  '添加': 'add',
+  'add': 'add',
+  'plus': 'add',
+  '编辑': 'edit',
+  'edit': 'edit',
+  '修改': 'edit',
+  '保存': 'save',
+  'save': 'save',
+  '搜索': 'search',
+  'search': 'search',
+  '查找': 'search',
+  '关闭': 'close',
+  'close': 'close',
+  '取消': 'cancel',
+  'cancel': 'cancel',
+  '确认': 'confirm',
+  'confirm': 'confirm',
+  '确定': 'confirm',
+  '上传': 'upload',
+  'upload': 'upload',
+  '下载': 'download',
+  'download': 'download',
+  '设置': 'setting',
+  'setting': 'setting',
+  '配置': 'setting',
+  '用户': 'user',
+  'user': 'user',
+  '主页': 'home',
+  'home': 'home',
+  '菜单': 'menu',
+  'menu': 'menu',
+  '更多': 'more',
+  'more': 'more',
+};
+const KEYWORD_ENTRIES = Object.entries(KEYWORD_MAP);
+
 /**
  * 通过大模型生成图标
  * @param {string} description - 图标描述
@@ -196,25 +260,7 @@ function buildPrompt(description, style) {
  * 构建 SVG 代码生成的提示词
  */
 function buildSVGPrompt(description, style) {
-  const styleGuidelines = {
-    'element-plus': {
-      style: 'Element Plus',
-      characteristics: 'minimalist, clean lines, modern, simple geometric shapes, single color (currentColor), 24x24 viewBox',
-      examples: 'Use simple paths, circles, rectangles. Avoid complex gradients. Use fill="currentColor" for single color icons.'
-    },
-    'ant-design': {
-      style: 'Ant Design',
-      characteristics: 'professional, consistent stroke width (1.5-2px), rounded corners, balanced proportions, 24x24 viewBox',
-      examples: 'Use stroke-based design, consistent line width, rounded end caps. Use fill="none" and stroke="currentColor".'
-    },
-    default: {
-      style: 'Simple',
-      characteristics: 'clean, simple, modern, 24x24 viewBox, single color',
-      examples: 'Use simple shapes, clear lines, fill="currentColor" or stroke="currentColor".'
-    }
-  };
-
-  const guidelines = styleGuidelines[style] || styleGuidelines.default;
+  const guidelines = SVG_STYLE_GUIDELINES[style] || SVG_STYLE_GUIDELINES.default;
 
   return `Generate a ${guidelines.style} style SVG icon based on this description: "${description}"
 
@@ -288,34 +334,8 @@ async function searchIconFromLibrary(description, style) {
       return null;
     }
 
-    // 根据 style 决定搜索哪些图标库
-    let allIcons = [];
-
-    if (!style || style === 'default') {
-      // 两者都搜索
-      for (const keyword of searchKeywords) {
-        const elementPlusIcons = await getElementPlusIcons(keyword);
-        const antDesignIcons = await getAntDesignIcons(keyword);
-        allIcons.push(...elementPlusIcons, ...antDesignIcons);
-      }
-    } else if (style === 'element-plus') {
-      // 只搜索 Element Plus
-      for (const keyword of searchKeywords) {
-        const elementPlusIcons = await getElementPlusIcons(keyword);
-        allIcons.push(...elementPlusIcons);
-      }
-    } else if (style === 'ant-design') {
-      // 只搜索 Ant Design
-      for (const keyword of searchKeywords) {
-        const antDesignIcons = await getAntDesignIcons(keyword);
-        allIcons.push(...antDesignIcons);
-      }
-    }
-
-    // 去重
-    const uniqueIcons = Array.from(
-      new Map(allIcons.map((icon) => [`${icon.source}-${icon.name}`, icon])).values()
-    );
+    // 根据 style 决定搜索哪些图标库，所有关键词合并为一次批量搜索
+    const uniqueIcons = await searchIconsMany(searchKeywords, style);
 
     if (uniqueIcons.length === 0) {
       // logger.info('No icons found in library', { description, style, keywords: searchKeywords });
@@ -343,49 +363,9 @@ function extractSearchKeywords(description) {
   // 将描述转换为小写
   const lowerDesc = description.toLowerCase();
 
-  // 常见图标关键词映射
-  const keywordMap = {
-    '删除': 'delete',
-    'delete': 'delete',
-    'remove': 'delete',
-    '添加': 'add',
-    'add': 'add',
-    'plus': 'add',
-    '编辑': 'edit',
-    'edit': 'edit',
-    '修改': 'edit',
-    '保存': 'save',
-    'save': 'save',
-    '搜索': 'search',
-    'search': 'search',
-    '查找': 'search',
-    '关闭': 'close',
-    'close': 'close',
-    '取消': 'cancel',
-    'cancel': 'cancel',
-    '确认': 'confirm',
-    'confirm': 'confirm',
-    '确定': 'confirm',
-    '上传': 'upload',
-    'upload': 'upload',
-    '下载': 'download',
-    'download': 'download',
-    '设置': 'setting',
-    'setting': 'setting',
-    '配置': 'setting',
-    '用户': 'user',
-    'user': 'user',
-    '主页': 'home',
-    'home': 'home',
-    '菜单': 'menu',
-    'menu': 'menu',
-    '更多': 'more',
-    'more': 'more',
-  };
-
   // 尝试匹配关键词
   const keywords = [];
-  for (const [key, value] of Object.entries(keywordMap)) {
+  for (const [key, value] of KEYWORD_ENTRIES) {
     if (lowerDesc.includes(key)) {
       keywords.push(value);
     }
@@ -414,7 +394,7 @@ async function generateSVGWithOpenAI(prompt) {
     throw new Error('OpenAI API key not found');
   }
 
-  const response = await axios.post(
+  const response = await httpClient.post(
     'https://api.openai.com/v1/chat/completions',
     {
       model: 'gpt-4o-mini', // 使用更便宜的模型
@@ -453,7 +433,7 @@ async function generateSVGWithTongyi(prompt) {
   if (!apiKey) {
     throw new Error('DashScope API key not found');
   }
-  const response = await axios.post(
+  const response = await httpClient.post(
     'https://dashscope.aliyuncs.com/api/v1/services/aigc/text-generation/generation',
     {
       model: 'qwen-turbo',
@@ -576,7 +556,7 @@ async function generateWithOpenAI(prompt) {
     throw new Error('OpenAI API key not found');
   }
 
-  const response = await axios.post(
+  const response = await httpClient.post(
     'https://api.openai.com/v1/images/generations',
     {
       model: 'dall-e-3',
@@ -609,7 +589,7 @@ async function generateWithTongyi(prompt) {
   }
 
   try {
-    const response = await axios.post(
+    const response = await httpClient.post(
       'https://dashscope.aliyuncs.com/api/v1/services/aigc/text2image/image-synthesis',
       {
         model: 'wanx-v1', // 通义万相模型（标准版）
@@ -672,7 +652,7 @@ async function generateWithWenxin(prompt) {
   }
 
   // 获取 access_token
-  const tokenResponse = await axios.post(
+  const tokenResponse = await httpClient.post(
     `https://aip.baidubce.com/oauth/2.0/token?grant_type=client_credentials&client_id=${apiKey}&client_secret=${secretKey}`,
     {},
     {
@@ -689,7 +669,7 @@ async function generateWithWenxin(prompt) {
   }
 
   // 调用文心一格 API
-  const response = await axios.post(
+  const response = await httpClient.post(
     `https://aip.baidubce.com/rest/2.0/solution/v1/img_cheng/v1?access_token=${accessToken}`,
     {
       prompt: prompt,
@@ -725,7 +705,7 @@ async function generateWithZhipu(prompt) {
 
   // 智谱AI 目前主要通过 GLM 模型，图像生成可能需要使用其他服务
   // 这里提供一个基础实现，实际使用时可能需要调整
-  const response = await axios.post(
+  const response = await httpClient.post(
     'https://open.bigmodel.cn/api/paas/v4/images/generations',
     {
       model: 'cogview-3',
@@ -761,7 +741,7 @@ async function generateWithKimi(prompt) {
 
   // Kimi 主要通过 Moonshot API，图像生成可能需要使用其他服务
   // 这里提供一个基础实现
-  const response = await axios.post(
+  const response = await httpClient.post(
     'https://api.moonshot.cn/v1/images/generations',
     {
       model: 'moonshot-image',
@@ -799,7 +779,7 @@ async function generateWithDoubao(prompt) {
   try {
     // 豆包（字节跳动）图像生成 API
     // API 端点：火山引擎（Volcano Engine）
-    const response = await axios.post(
+    const response = await httpClient.post(
       'https://ark.cn-beijing.volces.com/api/v3/images/generations',
       {
         model: 'doubao-seedream-4-0-250828', // 豆包图像生成模型
@@ -850,7 +830,7 @@ async function generateWithHuggingFace(prompt) {
   try {
     // 使用 Hugging Face Inference API（免费，无需 API Key）
     // 使用 Stable Diffusion 2.1 模型
-    const response = await axios.post(
+    const response = await httpClient.post(
       'https://api-inference.huggingface.co/models/stabilityai/stable-diffusion-2-1',
       {
         inputs: prompt,
@@ -1,4 +1,5 @@
-const axios = require('axios');
+const { httpClient } = require('./httpClient');
+const { LRUCache } = require('./lruCache');
 // const logger = require('./logger');
 
 // Element Plus 图标仓库信息
@@ -6,6 +7,11 @@ const ELEMENT_PLUS_REPO_URL = 'https://api.github.com/repos/element-plus/element
 // Ant Design 图标仓库信息
 const ANT_DESIGN_REPO_URL = 'https://api.github.com/repos/ant-design/ant-design-icons/contents/packages/icons-svg/svg/outlined';
 
+// 搜索结果缓存（键为 图标库:名称），重复查询无需再次请求 GitHub
+const searchCache = new LRUCache({ maxSize: 512, ttl: 10 * 60 * 1000 });
+// 图标列表缓存（键为 图标库），只保留搜索所需的精简字段
+const iconListCache = new LRUCache({ maxSize: 8, ttl: 10 * 60 * 1000 });
+
 /**
  * 将短横线命名转换为驼峰命名
  * @param {string} str - 短横线分隔的字符串
@@ -79,59 +85,157 @@ function iconsToMarkdownTable(icons) {
 }
 
 /**
- * 从Element Plus获取图标信息
- * @param {string} name - 图标名称（模糊匹配）
- * @returns {Promise<Array>} 匹配的图标数组
+ * 并发获取匹配图标的SVG内容，单个图标获取失败不影响其他图标
+ * @param {Array} matchedIcons - 包含 source、name、svgUrl 的图标数组
+ * @returns {Promise<Array>} 成功获取SVG的图标数组（保持原有顺序）
  */
-async function getElementPlusIcons(name) {
-  try {
-    // logger.info('Fetching Element Plus icons from GitHub', { searchTerm: name });
-    const response = await axios.get(ELEMENT_PLUS_REPO_URL);
-    const files = response.data;
-    // logger.debug('Received Element Plus icons list', { totalFiles: files.length });
-
-    // 过滤出SVG文件并进行模糊匹配
-    const matchedIcons = files
-      .filter(file => file.name.endsWith('.svg') && file.name.toLowerCase().includes(name.toLowerCase()))
-      .map(file => ({
-        source: 'Element Plus',
-        name: toCamelCase(file.name.replace('.svg', '')),
-        svgUrl: file.download_url
-      }));
-
-    // logger.debug('Filtered Element Plus icons', { matchedCount: matchedIcons.length });
-
-    // 获取SVG内容
-    const icons = [];
-    for (const icon of matchedIcons) {
+async function fetchIconSvgs(matchedIcons) {
+  const results = await Promise.all(
+    matchedIcons.map(async (icon) => {
       try {
         // logger.debug('Fetching SVG content', { iconName: icon.name });
-        const svgResponse = await axios.get(icon.svgUrl);
+        // SVG 是纯文本，声明为 text 以跳过 axios 默认的 JSON.parse 尝试
+        const svgResponse = await httpClient.get(icon.svgUrl, { responseType: 'text' });
         const cleanedSvg = cleanSvgContent(svgResponse.data);
-        icons.push({
+        // logger.debug('Successfully fetched SVG content', { iconName: icon.name });
+        return {
           source: icon.source,
           name: icon.name,
           svg: svgResponse.data,
           rawSvg: cleanedSvg
-        });
-        // logger.debug('Successfully fetched SVG content', { iconName: icon.name });
+        };
       } catch (error) {
         // logger.error(`Failed to fetch SVG for ${icon.name}`, { error: error.message });
+        return null;
       }
+    })
+  );
+
+  return results.filter(Boolean);
+}
+
+/**
+ * 图标库配置
+ */
+const ELEMENT_PLUS_LIBRARY = {
+  key: 'element-plus',
+  source: 'Element Plus',
+  repoUrl: ELEMENT_PLUS_REPO_URL,
+  nameSuffix: '',
+};
+
+const ANT_DESIGN_LIBRARY = {
+  key: 'ant-design',
+  source: 'Ant Design',
+  repoUrl: ANT_DESIGN_REPO_URL,
+  nameSuffix: 'Outlined',
+};
+
+// 各风格需要搜索的图标库，未知风格搜索全部图标库
+const ALL_LIBRARIES = [ELEMENT_PLUS_LIBRARY, ANT_DESIGN_LIBRARY];
+const LIBRARIES_BY_STYLE = new Map([
+  ['element-plus', [ELEMENT_PLUS_LIBRARY]],
+  ['ant-design', [ANT_DESIGN_LIBRARY]],
+]);
+
+/**
+ * 获取图标库中的SVG文件列表
+ * GitHub 返回的每个条目包含十余个字段，这里只保留搜索需要的字段，并预先计算小写文件名
+ * @param {Object} library - 图标库配置
+ * @returns {Promise<Array>} 包含 fileName、lowerName、downloadUrl 的文件数组
+ */
+async function fetchIconList(library) {
+  const cached = iconListCache.get(library.key);
+  if (cached) {
+    return cached;
+  }
+
+  const response = await httpClient.get(library.repoUrl);
+  const svgFiles = [];
+  for (const file of response.data) {
+    if (file.name.endsWith('.svg')) {
+      svgFiles.push({
+        fileName: file.name,
+        lowerName: file.name.toLowerCase(),
+        downloadUrl: file.download_url
+      });
     }
+  }
+
+  iconListCache.set(library.key, svgFiles);
+  return svgFiles;
+}
+
+/**
+ * 在指定图标库中搜索多个名称，图标列表只请求一次
+ * @param {Object} library - 图标库配置
+ * @param {Array<string>} names - 图标名称数组（模糊匹配）
+ * @returns {Promise<Array<Array>>} 与 names 一一对应的匹配图标数组
+ */
+async function searchLibrary(library, names) {
+  const results = new Map();
+  const missedNames = [];
 
-    // logger.info('Finished fetching Element Plus icons', {
-    //   searchTerm: name,
-    //   matchedCount: matchedIcons.length,
-    //   successCount: icons.length
-    // });
-
-    // 直接返回图标数组，不添加冗余的content字段
-    return icons;
-  } catch (error) {
-    // logger.error('Failed to fetch Element Plus icons', { error: error.message, stack: error.stack });
-    return [];
+  for (const name of names) {
+    const cached = searchCache.get(`${library.key}:${name.toLowerCase()}`);
+    if (cached) {
+      results.set(name, cached);
+    } else {
+      missedNames.push(name);
+    }
   }
+
+  if (missedNames.length > 0) {
+    try {
+      // logger.info(`Fetching ${library.source} icons from GitHub`, { searchTerms: missedNames });
+      const svgFiles = await fetchIconList(library);
+      // logger.debug(`Received ${library.source} icons list`, { totalFiles: svgFiles.length });
+
+      // 各名称之间互不依赖，并发获取
+      await Promise.all(missedNames.map(async (name) => {
+        const lowerName = name.toLowerCase();
+
+        // 模糊匹配
+        const matchedIcons = svgFiles
+          .filter(file => file.lowerName.includes(lowerName))
+          .map(file => ({
+            source: library.source,
+            name: toCamelCase(file.fileName.replace('.svg', '')) + library.nameSuffix,
+            svgUrl: file.downloadUrl
+          }));
+
+        // 并发获取SVG内容
+        const icons = await fetchIconSvgs(matchedIcons);
+
+        // logger.info(`Finished fetching ${library.source} icons`, {
+        //   searchTerm: name,
+        //   matchedCount: matchedIcons.length,
+        //   successCount: icons.length
+        // });
+
+        // 只有全部SVG都获取成功才缓存，部分失败（如被限流）时下次仍会重新获取
+        if (icons.length === matchedIcons.length) {
+          searchCache.set(`${library.key}:${lowerName}`, icons);
+        }
+        results.set(name, icons);
+      }));
+    } catch (error) {
+      // logger.error(`Failed to fetch ${library.source} icons`, { error: error.message, stack: error.stack });
+    }
+  }
+
+  // 返回副本，避免调用方修改缓存中的数组
+  return names.map(name => (results.get(name) || []).slice());
+}
+
+/**
+ * 从Element Plus获取图标信息
+ * @param {string} name - 图标名称（模糊匹配）
+ * @returns {Promise<Array>} 匹配的图标数组
+ */
+async function getElementPlusIcons(name) {
+  const [icons] = await searchLibrary(ELEMENT_PLUS_LIBRARY, [name]);
+  return icons;
 }
 
 /**
@@ -140,58 +244,60 @@ async function getElementPlusIcons(name) {
  * @returns {Promise<Array>} 匹配的图标数组
  */
 async function getAntDesignIcons(name) {
-  try {
-    // logger.info('Fetching Ant Design icons from GitHub', { searchTerm: name });
-    const response = await axios.get(ANT_DESIGN_REPO_URL);
-    const files = response.data;
-    // logger.debug('Received Ant Design icons list', { totalFiles: files.length });
-
-    // 过滤出SVG文件并进行模糊匹配
-    const matchedIcons = files
-      .filter(file => file.name.endsWith('.svg') && file.name.toLowerCase().includes(name.toLowerCase()))
-      .map(file => ({
-        source: 'Ant Design',
-        name: toCamelCase(file.name.replace('.svg', '')),
-        svgUrl: file.download_url
-      }));
+  const [icons] = await searchLibrary(ANT_DESIGN_LIBRARY, [name]);
+  return icons;
+}
 
-    // logger.debug('Filtered Ant Design icons', { matchedCount: matchedIcons.length });
+/**
+ * 批量搜索多个名称的图标，每个图标库的图标列表只请求一次
+ * @param {Array<string>} names - 图标名称数组，重复的名称（不区分大小写）会被忽略
+ * @param {string} style - 图标风格：'element-plus' 只搜索 Element Plus，'ant-design' 只搜索 Ant Design，其他值两者都搜索
+ * @returns {Promise<Array>} 去重后的图标数组
+ */
+async function searchIconsMany(names, style = 'default') {
+  // 按小写去重（与缓存键和匹配规则一致），保留第一次出现的写法和原有顺序
+  const namesByLowerCase = new Map();
+  for (const name of names) {
+    const lowerName = name.toLowerCase();
+    if (!namesByLowerCase.has(lowerName)) {
+      namesByLowerCase.set(lowerName, name);
+    }
+  }
+  const uniqueNames = Array.from(namesByLowerCase.values());
 
-    // 获取SVG内容
-    const icons = [];
-    for (const icon of matchedIcons) {
-      try {
-        // logger.debug('Fetching SVG content', { iconName: icon.name });
-        const svgResponse = await axios.get(icon.svgUrl);
-        const cleanedSvg = cleanSvgContent(svgResponse.data);
-        icons.push({
-          source: icon.source,
-          name: icon.name + 'Outlined',
-          svg: svgResponse.data,
-          rawSvg: cleanedSvg
-        });
-        // logger.debug('Successfully fetched SVG content', { iconName: icon.name });
-      } catch (error) {
-        // logger.error(`Failed to fetch SVG for ${icon.name}`, { error: error.message });
-      }
+  const libraries = LIBRARIES_BY_STYLE.get(style) || ALL_LIBRARIES;
+
+  // 并发搜索各图标库
+  const libraryResults = await Promise.all(
+    libraries.map((library) => searchLibrary(library, uniqueNames))
+  );
+
+  // 按名称顺序合并，每个名称内按图标库顺序排列
+  const allIcons = [];
+  uniqueNames.forEach((name, index) => {
+    for (const iconsByName of libraryResults) {
+      allIcons.push(...iconsByName[index]);
     }
+  });
 
-    // logger.info('Finished fetching Ant Design icons', {
-    //   searchTerm: name,
-    //   matchedCount: matchedIcons.length,
-    //   successCount: icons.length
-    // });
-
-    // 直接返回图标数组，不添加冗余的content字段
-    return icons;
-  } catch (error) {
-    // logger.error('Failed to fetch Ant Design icons', { error: error.message, stack: error.stack });
-    return [];
-  }
+  // 去重（基于 source 和 name）
+  return Array.from(
+    new Map(allIcons.map((icon) => [`${icon.source}-${icon.name}`, icon])).values()
+  );
+}
+
+/**
+ * 清空图标搜索缓存
+ */
+function invalidateIconCache() {
+  searchCache.clear();
+  iconListCache.clear();
 }
 
 module.exports = {
   getElementPlusIcons,
   getAntDesignIcons,
-  iconsToMarkdownTable
-};
\ No newline at end of file
+  searchIconsMany,
+  iconsToMarkdownTable,
+  invalidateIconCache
+};
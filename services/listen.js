@@ -0,0 +1,97 @@
+const fs = require('fs');
+const http = require('http');
+const net = require('net');
+
+/**
+ * 检查套接字是否为上次异常退出遗留的文件：仍有服务器在监听时连接会成功，遗留文件则返回 ECONNREFUSED
+ * @param {string} socketPath - 套接字路径
+ * @param {Function} callback - 回调，参数为是否为遗留文件
+ */
+function isStaleSocket(socketPath, callback) {
+  const probe = net.connect(socketPath);
+  probe.once('connect', () => {
+    probe.destroy();
+    callback(false);
+  });
+  probe.once('error', (error) => {
+    callback(error.code === 'ECONNREFUSED');
+  });
+}
+
+/**
+ * 删除遗留的 Unix 域套接字文件，不会删除普通文件
+ * @param {string} socketPath - 套接字路径
+ * @returns {boolean} 是否已删除
+ */
+function removeSocketFile(socketPath) {
+  try {
+    if (fs.lstatSync(socketPath).isSocket()) {
+      fs.unlinkSync(socketPath);
+      return true;
+    }
+  } catch (error) {
+    // 文件不存在或无权限删除
+  }
+  return false;
+}
+
+/**
+ * 启动 HTTP 服务器
+ * 指定 socketPath 时优先监听 Unix 域套接字（Windows 下为命名管道），同机调用无需经过 TCP 协议栈；
+ * 套接字被其他正在运行的服务器占用或监听失败时回退到 TCP 端口
+ * @param {Function} app - Express 应用
+ * @param {Object} options
+ * @param {number|string} options.port - TCP 端口
+ * @param {string} [options.socketPath] - Unix 域套接字路径或命名管道名称
+ * @param {Function} [callback] - 监听成功后的回调
+ * @returns {http.Server} HTTP 服务器实例
+ */
+function listen(app, { port, socketPath }, callback) {
+  const server = http.createServer(app);
+  const listenTcp = () => server.listen(port, '0.0.0.0', callback);
+
+  if (!socketPath) {
+    listenTcp();
+    return server;
+  }
+
+  let staleChecked = false;
+
+  const onSocketListening = () => {
+    server.removeListener('error', onSocketError);
+    if (callback) {
+      callback();
+    }
+  };
+  const fallbackToTcp = () => {
+    server.removeListener('listening', onSocketListening);
+    listenTcp();
+  };
+  const onSocketError = (error) => {
+    // 地址被占用时，只有确认没有服务器在监听（遗留文件）才删除并重试，绝不接管正在使用的套接字
+    if (error.code !== 'EADDRINUSE' || staleChecked || process.platform === 'win32') {
+      fallbackToTcp();
+      return;
+    }
+
+    staleChecked = true;
+    isStaleSocket(socketPath, (stale) => {
+      if (!stale || !removeSocketFile(socketPath)) {
+        fallbackToTcp();
+        return;
+      }
+      server.once('error', onSocketError);
+      server.listen(socketPath);
+    });
+  };
+
+  server.once('listening', onSocketListening);
+  server.once('error', onSocketError);
+  server.listen(socketPath);
+
+  return server;
+}
+
+module.exports = {
+  listen,
+};
@@ -0,0 +1,64 @@
+/**
+ * 简单的 LRU 缓存，支持容量上限和过期时间
+ * 利用 Map 保持插入顺序的特性：最近使用的条目总是位于末尾
+ */
+class LRUCache {
+  /**
+   * @param {Object} options
+   * @param {number} options.maxSize - 最大缓存条目数
+   * @param {number} options.ttl - 条目过期时间（毫秒），0 表示永不过期
+   */
+  constructor({ maxSize = 512, ttl = 0 } = {}) {
+    this.maxSize = maxSize;
+    this.ttl = ttl;
+    this.entries = new Map();
+  }
+
+  /**
+   * 读取缓存，命中时将条目移动到末尾
+   * @param {string} key - 缓存键
+   * @returns {*} 缓存值，未命中或已过期时返回 undefined
+   */
+  get(key) {
+    const entry = this.entries.get(key);
+    if (!entry) {
+      return undefined;
+    }
+
+    this.entries.delete(key);
+    if (this.ttl && Date.now() > entry.expiresAt) {
+      return undefined;
+    }
+
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  /**
+   * 写入缓存，超出容量时淘汰最久未使用的条目
+   * @param {string} key - 缓存键
+   * @param {*} value - 缓存值
+   */
+  set(key, value) {
+    this.entries.delete(key);
+    this.entries.set(key, {
+      value,
+      expiresAt: this.ttl ? Date.now() + this.ttl : 0,
+    });
+
+    if (this.entries.size > this.maxSize) {
+      this.entries.delete(this.entries.keys().next().value);
+    }
+  }
+
+  /**
+   * 清空缓存
+   */
+  clear() {
+    this.entries.clear();
+  }
+}
+
+module.exports = {
+  LRUCache,
+};